@@ -1,19 +1,29 @@
 import os
 
+from ..utils.fsutil import ensure_dir
+
 # Application settings
 APP_NAME = "Financial Anomaly Detector"
 APP_VERSION = "1.0.0"
 
 # Directory settings
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-LOG_DIR = os.path.join(BASE_DIR, 'logs')
-PLOT_DIR = os.path.join(BASE_DIR, 'plots')
-DATA_DIR = os.path.join(BASE_DIR, 'data')
 
-# Ensure directories exist
-for directory in [LOG_DIR, PLOT_DIR, DATA_DIR]:
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+# LOG_DIR, PLOT_DIR and DATA_DIR are resolved (and created) on first access
+_DIR_DEFS = {
+    'LOG_DIR': 'logs',
+    'PLOT_DIR': 'plots',
+    'DATA_DIR': 'data'
+}
+
+def __getattr__(name):
+    """Resolve directory settings lazily, creating the directory on first access"""
+    if name in _DIR_DEFS:
+        path = os.path.join(BASE_DIR, _DIR_DEFS[name])
+        ensure_dir(path)
+        globals()[name] = path
+        return path
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Analysis settings
 DEFAULT_CONTAMINATION = 0.1  # Default contamination factor for Isolation Forest
@@ -39,5 +49,3 @@ LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 # Plot settings
 PLOT_DPI = 300
-PLOT_STYLE = 'seaborn'
-COLOR_PALETTE = 'husl'
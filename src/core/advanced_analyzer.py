@@ -5,10 +5,11 @@ from typing import List, Dict, Optional, Tuple
 import logging
 import matplotlib.pyplot as plt
 from datetime import datetime
-import seaborn as sns
 from sklearn.preprocessing import StandardScaler
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
+from ..utils.visualization import get_figure_axes, save_and_clear
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -157,30 +158,45 @@ class AdvancedAnomalyAnalyzer:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # 1. Individual feature plots against target
-        for feature in self.analysis_features:
-            plt.figure(figsize=(12, 6))
-            plt.scatter(df[feature][predictions == 1],
-                      df[self.target_feature][predictions == 1],
-                      c='blue', label='Normal')
-            plt.scatter(df[feature][predictions == -1],
-                      df[self.target_feature][predictions == -1],
-                      c='red', label='Anomaly')
-            plt.xlabel(feature)
-            plt.ylabel(self.target_feature)
-            plt.title(f'{self.target_feature} vs {feature}')
-            plt.legend()
-            plt.savefig(output_dir / f'plot_{self.target_feature}_vs_{feature}.png')
-            plt.close()
+        # 1. Individual feature plots against target, rendered in parallel
+        # (each worker thread draws on its own figure)
+        if self.analysis_features:
+            workers = min(8, len(self.analysis_features))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(
+                    lambda feature: self._plot_feature_vs_target(df, predictions, feature, output_dir),
+                    self.analysis_features
+                ))
             
         # 2. Anomaly score distribution
         plt.figure(figsize=(12, 6))
-        sns.histplot(data=df, x=self.analyzer.anomaly_scores, bins=50)
+        plt.hist(self.analyzer.anomaly_scores, bins=50)
         plt.xlabel('Anomaly Score')
         plt.title('Distribution of Anomaly Scores')
         plt.savefig(output_dir / 'anomaly_score_distribution.png')
         plt.close()
     
+    def _plot_feature_vs_target(self,
+                                df: pd.DataFrame,
+                                predictions: np.ndarray,
+                                feature: str,
+                                output_dir: Path):
+        """
+        Save a scatter plot of one feature against the target feature
+        """
+        fig, ax = get_figure_axes((12, 6))
+        ax.scatter(df[feature][predictions == 1],
+                   df[self.target_feature][predictions == 1],
+                   c='blue', label='Normal')
+        ax.scatter(df[feature][predictions == -1],
+                   df[self.target_feature][predictions == -1],
+                   c='red', label='Anomaly')
+        ax.set_xlabel(feature)
+        ax.set_ylabel(self.target_feature)
+        ax.set_title(f'{self.target_feature} vs {feature}')
+        ax.legend()
+        save_and_clear(fig, output_dir / f'plot_{self.target_feature}_vs_{feature}.png')
+    
     def _save_feature_contributions(self, output_dir: str):
         """
         Save feature contributions to a text file
@@ -8,23 +8,19 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QTabWidget, QCheckBox, QGroupBox)
 from PySide6.QtCore import Qt, QThread, Signal, QMutex
 from PySide6.QtGui import QPixmap
-import pandas as pd
-import numpy as np
 from pathlib import Path
-from ..core.advanced_analyzer import AdvancedAnomalyAnalyzer
 import logging
-import matplotlib
-matplotlib.use('Agg')  # Use Agg backend for thread safety
-import matplotlib.pyplot as plt
-import seaborn as sns
 from queue import Queue
 import traceback
 from datetime import datetime
 
 from .widgets.feature_options import FeatureOptionsWidget
 from .widgets.plot_viewer import PlotViewer
-from .workers.analysis_worker import AnalysisWorker
-from ..utils.logging_config import QTextEditLogger, setup_logging
+from ..utils.logging_config import QTextEditLogger, BufferedLogHandler, setup_logging
+
+# pandas, numpy, matplotlib and the analysis worker (which pulls in the
+# analyzer stack) are imported inside the methods that need them so the
+# window can be shown before those modules load
 
 class AnomalyDetectorGUI(QMainWindow):
     def __init__(self):
@@ -44,16 +40,30 @@ class AnomalyDetectorGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         self.main_layout.addWidget(self.tab_widget)
         
-        # Create and add tabs
+        # Create and add tabs; results and logs are populated when first shown
         self.setup_analysis_tab()
-        self.setup_results_tab()
-        self.setup_logs_tab()
+        self.results_tab = QWidget()
+        self.logs_tab = QWidget()
+        self.tab_widget.addTab(self.results_tab, "Results")
+        self.tab_widget.addTab(self.logs_tab, "Logs")
+        self.pending_tabs = {
+            self.results_tab: self.setup_results_tab,
+            self.logs_tab: self.setup_logs_tab
+        }
+        self.plot_viewer = None
+        self.log_text = None
+        self.tab_widget.currentChanged.connect(self.on_tab_shown)
+        
+        # Hold log records until the logs tab exists
+        self.log_buffer = BufferedLogHandler()
+        logging.getLogger().addHandler(self.log_buffer)
         
         # Initialize analysis worker
         self.analysis_thread = None
         
         # Store current data and results
         self.current_data = None
+        self.numeric_cols = []
         self.current_result = None
         self.output_dir = None
         
@@ -109,6 +119,7 @@ class AnomalyDetectorGUI(QMainWindow):
         # Feature options container
         self.feature_options_container = QWidget()
         self.feature_options_layout = QVBoxLayout(self.feature_options_container)
+        self.feature_widgets = {}  # feature name -> FeatureOptionsWidget
         
         # Create scroll area for feature options
         feature_options_scroll = QScrollArea()
@@ -146,31 +157,36 @@ class AnomalyDetectorGUI(QMainWindow):
         # Add tab
         self.tab_widget.addTab(analysis_tab, "Analysis")
         
+    def on_tab_shown(self, index):
+        """Populate a deferred tab the first time it is shown"""
+        setup = self.pending_tabs.pop(self.tab_widget.widget(index), None)
+        if setup:
+            setup()
+        
     def setup_results_tab(self):
         """Set up the results tab with plot viewer"""
-        results_tab = QWidget()
-        layout = QVBoxLayout(results_tab)
+        layout = QVBoxLayout(self.results_tab)
         
         # Add plot viewer
         self.plot_viewer = PlotViewer()
         layout.addWidget(self.plot_viewer)
         
-        self.tab_widget.addTab(results_tab, "Results")
-        
     def setup_logs_tab(self):
         """Set up the logs tab with log viewer"""
-        logs_tab = QWidget()
-        layout = QVBoxLayout(logs_tab)
+        layout = QVBoxLayout(self.logs_tab)
         
         # Add log viewer
         self.log_text = QTextEdit()
         layout.addWidget(self.log_text)
         
-        # Set up logging to text widget
+        # Set up logging to text widget, replaying records logged so far
         log_handler = QTextEditLogger(self.log_text)
-        logging.getLogger().addHandler(log_handler)
-        
-        self.tab_widget.addTab(logs_tab, "Logs")
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self.log_buffer)
+        for record in self.log_buffer.records:
+            log_handler.handle(record)
+        self.log_buffer.records.clear()
+        root_logger.addHandler(log_handler)
         
     def load_data(self):
         """Load data from CSV file"""
@@ -183,8 +199,29 @@ class AnomalyDetectorGUI(QMainWindow):
         
         if file_path:
             try:
-                # Load data
-                self.current_data = pd.read_csv(file_path)
+                import pandas as pd
+                import numpy as np
+                
+                # Infer float columns from a sample, then read the whole file
+                # with those columns typed as float32 up front. Integer
+                # columns keep int64: float32 is only exact up to 2**24,
+                # which would corrupt dates and volumes.
+                sample = pd.read_csv(file_path, nrows=1000)
+                float_cols = sample.select_dtypes(include='floating').columns
+                try:
+                    self.current_data = pd.read_csv(
+                        file_path,
+                        engine='c',
+                        memory_map=True,
+                        dtype={col: np.float32 for col in float_cols}
+                    )
+                except ValueError:
+                    # A column looked numeric in the sample but holds a bad
+                    # value further down; this costs a third read of the file
+                    self.current_data = pd.read_csv(file_path)
+                self.numeric_cols = list(
+                    self.current_data.select_dtypes(include=[np.number]).columns
+                )
                 self.input_file_label.setText(os.path.basename(file_path))
                 
                 # Update feature selection
@@ -222,31 +259,36 @@ class AnomalyDetectorGUI(QMainWindow):
             self.target_feature_combo.clear()
             self.feature_list.clear()
             
-            # Get numeric columns
-            numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
-            
             # Update target feature combo box
-            self.target_feature_combo.addItems(numeric_cols)
+            self.target_feature_combo.addItems(self.numeric_cols)
             
             # Update analysis features list
-            self.feature_list.addItems(numeric_cols)
+            self.feature_list.addItems(self.numeric_cols)
             
             # Update feature options
             self.update_feature_options()
             
     def update_feature_options(self):
         """Update feature options based on selected features"""
-        # Clear existing options
-        for i in reversed(range(self.feature_options_layout.count())):
-            widget = self.feature_options_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        
-        # Add options for each numeric feature
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
-        for feature in numeric_cols:
-            option_widget = FeatureOptionsWidget(feature)
-            self.feature_options_layout.addWidget(option_widget)
+        numeric_cols = self.numeric_cols
+        
+        # Remove options for features that are no longer present
+        for feature in set(self.feature_widgets) - set(numeric_cols):
+            widget = self.feature_widgets.pop(feature)
+            self.feature_options_layout.removeWidget(widget)
+            widget.deleteLater()
+        
+        # Add options for new features, reusing existing ones in column order
+        for position, feature in enumerate(numeric_cols):
+            option_widget = self.feature_widgets.get(feature)
+            if option_widget is None:
+                option_widget = FeatureOptionsWidget(feature)
+                self.feature_widgets[feature] = option_widget
+            elif self.feature_options_layout.indexOf(option_widget) == position:
+                continue
+            else:
+                self.feature_options_layout.removeWidget(option_widget)
+            self.feature_options_layout.insertWidget(position, option_widget)
             
     def get_feature_options(self):
         """Get current feature options"""
@@ -277,6 +319,10 @@ class AnomalyDetectorGUI(QMainWindow):
         # Get feature options
         feature_options = self.get_feature_options()
         
+        import matplotlib
+        matplotlib.use('Agg')  # Use Agg backend for thread safety
+        from .widgets.analysis_worker import AnalysisWorker
+        
         # Create and start analysis thread
         self.analysis_thread = AnalysisWorker(
             input_file=self.input_file_label.text(),
@@ -303,6 +349,11 @@ class AnomalyDetectorGUI(QMainWindow):
         """Handle completed analysis"""
         self.current_result = result
         
+        # Switch to results tab
+        results_index = self.tab_widget.indexOf(self.results_tab)
+        self.tab_widget.setCurrentIndex(results_index)
+        self.on_tab_shown(results_index)
+        
         # Update plot viewer
         if self.output_dir:
             self.plot_viewer.set_plots_directory(self.output_dir)
@@ -310,9 +361,6 @@ class AnomalyDetectorGUI(QMainWindow):
         # Re-enable run button
         self.run_button.setEnabled(True)
         
-        # Switch to results tab
-        self.tab_widget.setCurrentIndex(1)
-        
         logging.info("Analysis completed")
         
     def load_config(self):
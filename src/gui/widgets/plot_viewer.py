@@ -1,6 +1,6 @@
 import os
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QSize
 from PySide6.QtGui import QPixmap
 
 class PlotViewer(QWidget):
@@ -27,6 +27,14 @@ class PlotViewer(QWidget):
         
         self.plots_dir = None
         
+        # (mtime, device pixel ratio) of the smooth-scaled image each plot
+        # label shows, keyed by path; a mismatch means the image is reloaded
+        self._plot_versions = {}
+        # Plots shown with a fast scale, awaiting a smooth one
+        self._pending_smooth = []
+        # Widgets for each displayed plot keyed by path: (container, image label)
+        self._plot_widgets = {}
+        
     def set_plots_directory(self, directory):
         """Set the directory containing plot images"""
         self.plots_dir = directory
@@ -34,31 +42,72 @@ class PlotViewer(QWidget):
         
     def load_plots(self):
         """Load and display all plot images from the plots directory"""
-        # Clear existing plots
-        for i in reversed(range(self.plot_layout.count())):
-            widget = self.plot_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        
-        if not self.plots_dir or not os.path.exists(self.plots_dir):
-            return
+        self._pending_smooth = []
+        
+        entries = []
+        if self.plots_dir and os.path.exists(self.plots_dir):
+            with os.scandir(self.plots_dir) as it:
+                entries = sorted((entry for entry in it if entry.name.endswith('.png')),
+                                 key=lambda entry: entry.name)
+        current = {entry.path for entry in entries}
+        
+        # Remove plots whose files are gone
+        for path in self._plot_widgets.keys() - current:
+            plot_widget, _ = self._plot_widgets.pop(path)
+            self.plot_layout.removeWidget(plot_widget)
+            plot_widget.deleteLater()
+            self._plot_versions.pop(path, None)
+        
+        # Add new plots in name order and reload images whose file changed
+        dpr = self.devicePixelRatioF()
+        for position, entry in enumerate(entries):
+            if entry.path in self._plot_widgets:
+                plot_label = self._plot_widgets[entry.path][1]
+            else:
+                plot_widget, plot_label = self._create_plot_widget(entry.name)
+                self._plot_widgets[entry.path] = (plot_widget, plot_label)
+                self.plot_layout.insertWidget(position, plot_widget)
+            
+            mtime = entry.stat().st_mtime
+            if self._plot_versions.get(entry.path) != (mtime, dpr):
+                pixmap = QPixmap(entry.path)
+                plot_label.setPixmap(self._scale_pixmap(pixmap, dpr, Qt.TransformationMode.FastTransformation))
+                self._pending_smooth.append((entry.path, mtime, dpr, pixmap, plot_label))
+        
+        if self._pending_smooth:
+            QTimer.singleShot(0, self._smooth_pending_plots)
             
-        # Load each PNG file
-        for filename in sorted(os.listdir(self.plots_dir)):
-            if filename.endswith('.png'):
-                # Create label for plot title
-                title = filename.replace('.png', '').replace('_', ' ').title()
-                title_label = QLabel(title)
-                title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.plot_layout.addWidget(title_label)
-                
-                # Create label for plot image
-                plot_label = QLabel()
-                pixmap = QPixmap(os.path.join(self.plots_dir, filename))
-                scaled_pixmap = pixmap.scaled(800, 600, Qt.AspectRatioMode.KeepAspectRatio)
-                plot_label.setPixmap(scaled_pixmap)
-                plot_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.plot_layout.addWidget(plot_label)
-                
-                # Add spacing between plots
-                self.plot_layout.addSpacing(20)
+    def _create_plot_widget(self, filename):
+        """Create the title and image labels for one plot file"""
+        plot_widget = QWidget()
+        layout = QVBoxLayout(plot_widget)
+        
+        # Create label for plot title
+        title = filename.replace('.png', '').replace('_', ' ').title()
+        title_label = QLabel(title)
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+        
+        # Create label for plot image
+        plot_label = QLabel()
+        plot_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(plot_label)
+        
+        # Add spacing between plots
+        layout.addSpacing(20)
+        return plot_widget, plot_label
+            
+    def _smooth_pending_plots(self):
+        """Replace fast-scaled plots with smooth-scaled ones and record their versions"""
+        for path, mtime, dpr, pixmap, plot_label in self._pending_smooth:
+            scaled_pixmap = self._scale_pixmap(pixmap, dpr, Qt.TransformationMode.SmoothTransformation)
+            self._plot_versions[path] = (mtime, dpr)
+            plot_label.setPixmap(scaled_pixmap)
+        self._pending_smooth = []
+        
+    @staticmethod
+    def _scale_pixmap(pixmap, dpr, mode):
+        """Scale a plot to fit 800x600 logical pixels at the given device pixel ratio"""
+        scaled_pixmap = pixmap.scaled(QSize(800, 600) * dpr, Qt.AspectRatioMode.KeepAspectRatio, mode)
+        scaled_pixmap.setDevicePixelRatio(dpr)
+        return scaled_pixmap
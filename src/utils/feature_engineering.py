@@ -1,5 +1,93 @@
+import hashlib
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    import bottleneck as bn
+except ImportError:  # fall back to the NumPy implementations below
+    bn = None
+
+# Small LRU caches so re-running the analysis on the same data skips the
+# ratio and feature computations
+_CACHE_SIZE = 4
+_RATIOS_CACHE = OrderedDict()
+_FEATURES_CACHE = OrderedDict()
+
+# Columns calculate_ratios reads
+_RATIO_INPUTS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+def _data_key(data, columns):
+    """
+    Content key for the given columns of a DataFrame.
+    
+    Keyed on the values rather than the object, so a freed frame whose id is
+    reused, or a frame edited in place, never hits a stale entry.
+    
+    Args:
+        data (pd.DataFrame): Input data
+        columns (iterable): Columns the cached result depends on
+        
+    Returns:
+        tuple: (column names, row count, digest of index and values)
+    """
+    subset = data[[col for col in dict.fromkeys(columns) if col in data.columns]]
+    row_hashes = pd.util.hash_pandas_object(subset, index=True).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes()).hexdigest()
+    return (tuple(subset.columns), len(data), digest)
+
+def _cache_get(cache, key):
+    """Return a cached value and mark it as most recently used"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _cache_put(cache, key, value):
+    """Store a value, evicting the least recently used entry when full"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _rolling_mean(values, window):
+    """
+    Trailing moving average over a 1-D array, NaN until the window is full.
+    
+    Args:
+        values (np.ndarray): Input values
+        window (int): Window size
+        
+    Returns:
+        np.ndarray: Moving average aligned with the input
+    """
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+    if bn is not None:
+        return bn.move_mean(values, window)
+    out = np.full(len(values), np.nan)
+    out[window - 1:] = sliding_window_view(values, window).mean(axis=-1)
+    return out
+
+def _rolling_std(values, window):
+    """
+    Trailing moving sample standard deviation, NaN until the window is full.
+    
+    Args:
+        values (np.ndarray): Input values
+        window (int): Window size
+        
+    Returns:
+        np.ndarray: Moving standard deviation aligned with the input
+    """
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+    if bn is not None:
+        return bn.move_std(values, window, ddof=1)
+    out = np.full(len(values), np.nan)
+    out[window - 1:] = sliding_window_view(values, window).std(axis=-1, ddof=1)
+    return out
 
 def calculate_ratios(data):
     """
@@ -9,45 +97,68 @@ def calculate_ratios(data):
         data (pd.DataFrame): Input financial data
         
     Returns:
-        pd.DataFrame: DataFrame with calculated ratios
+        pd.DataFrame: DataFrame with calculated ratios (float32)
     """
-    ratios = pd.DataFrame(index=data.index)
+    key = _data_key(data, _RATIO_INPUTS)
+    cached = _cache_get(_RATIOS_CACHE, key)
+    if cached is not None:
+        return cached.copy()
     
-    # Price ratios
-    if 'High' in data.columns and 'Low' in data.columns:
-        ratios['price_range'] = (data['High'] - data['Low']) / data['Low']
+    # Pull each price/volume column out as an ndarray once and work on raw
+    # arrays; the DataFrame is built in one go at the end
+    def column(name):
+        return data[name].to_numpy(dtype=np.float64) if name in data.columns else None
     
-    if 'Close' in data.columns and 'Open' in data.columns:
-        ratios['price_change'] = (data['Close'] - data['Open']) / data['Open']
+    open_, high, low = column('Open'), column('High'), column('Low')
+    close, volume = column('Close'), column('Volume')
+    computed = {}
     
-    # Volume based ratios
-    if 'Volume' in data.columns and 'Close' in data.columns:
-        ratios['volume_price_ratio'] = data['Volume'] * data['Close']
-        
-        # Calculate moving averages of volume
-        ratios['volume_ma5'] = data['Volume'].rolling(window=5).mean()
-        ratios['volume_ma20'] = data['Volume'].rolling(window=20).mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Price ratios
+        if high is not None and low is not None:
+            computed['price_range'] = (high - low) / low
         
-        # Volume ratio
-        ratios['volume_ratio'] = data['Volume'] / ratios['volume_ma5']
-    
-    # Technical indicators
-    if 'Close' in data.columns:
-        # Moving averages
-        ratios['ma5'] = data['Close'].rolling(window=5).mean()
-        ratios['ma20'] = data['Close'].rolling(window=20).mean()
+        if close is not None and open_ is not None:
+            computed['price_change'] = (close - open_) / open_
         
-        # RSI
-        delta = data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        ratios['RSI'] = 100 - (100 / (1 + rs))
+        # Volume based ratios
+        if volume is not None and close is not None:
+            computed['volume_price_ratio'] = volume * close
+            
+            # Calculate moving averages of volume
+            computed['volume_ma5'] = _rolling_mean(volume, 5)
+            computed['volume_ma20'] = _rolling_mean(volume, 20)
+            
+            # Volume ratio
+            computed['volume_ratio'] = volume / computed['volume_ma5']
         
-        # Volatility
-        ratios['volatility'] = data['Close'].rolling(window=20).std()
+        # Technical indicators
+        if close is not None:
+            # Moving averages
+            computed['ma5'] = _rolling_mean(close, 5)
+            computed['ma20'] = _rolling_mean(close, 20)
+            
+            # RSI
+            delta = np.empty_like(close)
+            delta[:1] = 0.0
+            np.subtract(close[1:], close[:-1], out=delta[1:])
+            # fmax treats NaN deltas (gaps in Close) as no gain and no loss
+            gain = _rolling_mean(np.fmax(delta, 0.0), 14)
+            loss = _rolling_mean(np.fmax(-delta, 0.0), 14)
+            rs = gain / loss
+            computed['RSI'] = 100 - (100 / (1 + rs))
+            
+            # Volatility
+            computed['volatility'] = _rolling_std(close, 20)
     
-    return ratios.fillna(0)  # Replace NaN values with 0
+    ratios = pd.DataFrame(computed, index=data.index)
+    
+    # float32 keeps ~7 significant digits, plenty for ratios and indicators,
+    # and halves the memory the anomaly model has to stream through
+    ratios = ratios.astype(np.float32, copy=False)
+    ratios.fillna(0, inplace=True)  # Replace NaN values with 0
+    _cache_put(_RATIOS_CACHE, key, ratios)
+    return ratios.copy()
 
 def prepare_features(data, feature_options):
     """
@@ -58,19 +169,32 @@ def prepare_features(data, feature_options):
         feature_options (dict): Dictionary of feature options
         
     Returns:
-        np.ndarray: Prepared feature matrix
+        np.ndarray: Prepared feature matrix (float32)
     """
-    features = []
+    key = (_data_key(data, (*feature_options, *_RATIO_INPUTS)), tuple(
+        (name, tuple(sorted(options.items()))) for name, options in feature_options.items()
+    ))
+    cached = _cache_get(_FEATURES_CACHE, key)
+    if cached is not None:
+        return cached.copy()
+    
     ratios = calculate_ratios(data)
     
+    # Collect the source columns first so the output can be allocated once
+    columns = []
     for feature_name, options in feature_options.items():
         if feature_name in data.columns:
             if options.get('use_raw', True):
-                features.append(data[feature_name].values.reshape(-1, 1))
+                columns.append(data[feature_name])
             if options.get('use_ratio', True) and feature_name in ratios.columns:
-                features.append(ratios[feature_name].values.reshape(-1, 1))
+                columns.append(ratios[feature_name])
     
-    if not features:
+    if not columns:
         raise ValueError("No features selected for analysis")
     
-    return np.hstack(features)
+    features = np.empty((len(data), len(columns)), dtype=np.float32)
+    for i, column in enumerate(columns):
+        np.copyto(features[:, i], column.to_numpy(), casting='same_kind')
+    
+    _cache_put(_FEATURES_CACHE, key, features)
+    return features.copy()
@@ -0,0 +1,16 @@
+import os
+
+# Directories already ensured in this process
+_ensured = set()
+
+def ensure_dir(path):
+    """
+    Create a directory (and parents) once per process.
+    
+    Args:
+        path (str): Directory to create if missing
+    """
+    if path in _ensured:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured.add(path)
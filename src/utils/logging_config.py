@@ -1,6 +1,40 @@
 import logging
 import os
+from collections import deque
 from datetime import datetime
+from PySide6.QtCore import QObject, Signal
+
+from .fsutil import ensure_dir
+
+# Formatter shared by every handler the application installs
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOGGING_CONFIGURED = False
+
+class BufferedLogHandler(logging.Handler):
+    """Keeps the most recent log records in memory until a real view exists"""
+    
+    def __init__(self, capacity=500):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        
+    def emit(self, record):
+        self.records.append(record)
+
+class _LogSignal(QObject):
+    message = Signal(str)
+
+class QTextEditLogger(logging.Handler):
+    """Appends formatted log records to a QTextEdit, safe to log from any thread"""
+    
+    def __init__(self, text_edit):
+        super().__init__()
+        self.setFormatter(_FORMATTER)
+        # Records logged from worker threads are queued to the widget's thread
+        self._signal = _LogSignal()
+        self._signal.message.connect(text_edit.append)
+        
+    def emit(self, record):
+        self._signal.message.emit(self.format(record))
 
 def setup_logging(log_dir):
     """
@@ -9,23 +43,26 @@ def setup_logging(log_dir):
     Args:
         log_dir (str): Directory to store log files
     """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    
     # Create log directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    ensure_dir(log_dir)
     
     # Create log filename with timestamp
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f'anomaly_detector_{timestamp}.log')
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    # Configure logging. Handlers are added directly because basicConfig
+    # is a no-op once the root logger has any handler, which it already does
+    # by the time the GUI calls this
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    for handler in (logging.FileHandler(log_file), logging.StreamHandler()):
+        handler.setFormatter(_FORMATTER)
+        root_logger.addHandler(handler)
+    _LOGGING_CONFIGURED = True
     
     # Create logger
     logger = logging.getLogger('AnomalyDetector')
@@ -1,12 +1,106 @@
 import os
+import threading
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from cycler import cycler
 import numpy as np
 
+# seaborn "darkgrid" look with the 6-colour "husl" palette, as plain rcParams
+_HUSL_COLORS = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+_RCPARAMS = {
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.labelcolor': '.15',
+    'axes.prop_cycle': cycler('color', _HUSL_COLORS),
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'lines.solid_capstyle': 'round'
+}
+
+# Style settings are global, so they only need applying once per process
+_STYLE_APPLIED = False
+
 def setup_plot_style():
     """Set up the plotting style for consistent visualization"""
-    plt.style.use('seaborn')
-    sns.set_palette("husl")
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    plt.rcParams.update(_RCPARAMS)
+    _STYLE_APPLIED = True
+
+def _kde_curve(values, bins=512, points=200):
+    """
+    Gaussian kernel density estimate (Scott's rule bandwidth).
+    
+    The samples are pre-binned into a fine histogram so the cost does not
+    grow with the number of samples.
+    
+    Args:
+        values (np.ndarray): Sample values
+        bins (int): Number of bins used to summarise the samples
+        points (int): Number of points on the returned curve
+        
+    Returns:
+        tuple: (x, density) arrays, or (None, None) if the data is degenerate
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) < 2 or values.std() == 0:
+        return None, None
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    counts, edges = np.histogram(values, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    x = np.linspace(values.min() - 3 * bandwidth, values.max() + 3 * bandwidth, points)
+    z = (x[:, None] - centers[None, :]) / bandwidth
+    density = (np.exp(-0.5 * z ** 2) @ counts) / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+    return x, density
+
+# One figure per thread, shared by all plotters on that thread; cleared and
+# resized rather than recreated. The figure object lives as long as its
+# thread, so plotters clear it after saving (save_and_clear) to avoid keeping
+# the last plot's artists and data alive.
+_local = threading.local()
+
+def get_figure_axes(figsize):
+    """
+    Get a fresh Axes on the calling thread's shared figure.
+    
+    Args:
+        figsize (tuple): Figure size in inches
+        
+    Returns:
+        tuple: (Figure, Axes)
+    """
+    fig = getattr(_local, 'fig', None)
+    if fig is None:
+        fig = _local.fig = Figure(figsize=figsize)
+    else:
+        fig.clear()
+        fig.set_size_inches(*figsize)
+    return fig, fig.add_subplot()
+
+def save_and_clear(fig, path, **kwargs):
+    """
+    Save a figure, then clear it so it holds no plot data between calls.
+    
+    Args:
+        fig (Figure): Figure to save
+        path (str): Output file path
+        **kwargs: Extra arguments passed to Figure.savefig
+    """
+    try:
+        fig.savefig(path, **kwargs)
+    finally:
+        fig.clear()
     
 def create_time_series_plot(data, anomaly_scores, anomalies, feature_name, save_dir):
     """
@@ -20,26 +114,25 @@ def create_time_series_plot(data, anomaly_scores, anomalies, feature_name, save_
         save_dir (str): Directory to save the plot
     """
     setup_plot_style()
-    plt.figure(figsize=(12, 6))
+    fig, ax = get_figure_axes((12, 6))
     
     # Plot the time series
-    plt.plot(data.index, data.values, label='Original Data', alpha=0.7)
+    ax.plot(data.index, data.values, label='Original Data', alpha=0.7)
     
     # Highlight anomalies
     anomaly_points = data[anomalies]
-    plt.scatter(anomaly_points.index, anomaly_points.values, 
+    ax.scatter(anomaly_points.index, anomaly_points.values, 
                color='red', label='Anomalies', zorder=5)
     
-    plt.title(f'Anomalies in {feature_name}')
-    plt.xlabel('Time')
-    plt.ylabel('Value')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.set_title(f'Anomalies in {feature_name}')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Value')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # Save plot
     filename = f"{feature_name.lower().replace(' ', '_')}_anomalies.png"
-    plt.savefig(os.path.join(save_dir, filename), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_and_clear(fig, os.path.join(save_dir, filename), dpi=300, bbox_inches='tight')
 
 def create_score_distribution_plot(anomaly_scores, threshold, save_dir):
     """
@@ -51,24 +144,26 @@ def create_score_distribution_plot(anomaly_scores, threshold, save_dir):
         save_dir (str): Directory to save the plot
     """
     setup_plot_style()
-    plt.figure(figsize=(10, 6))
+    fig, ax = get_figure_axes((10, 6))
     
-    # Plot the distribution
-    sns.histplot(anomaly_scores, bins=50, kde=True)
+    # Plot the distribution with a KDE curve scaled to counts
+    _, edges, _ = ax.hist(anomaly_scores, bins=50, alpha=0.75)
+    x, density = _kde_curve(anomaly_scores)
+    if x is not None:
+        ax.plot(x, density * len(anomaly_scores) * (edges[1] - edges[0]))
     
     # Add threshold line
-    plt.axvline(x=threshold, color='r', linestyle='--', 
-                label=f'Threshold ({threshold:.2f})')
+    ax.axvline(x=threshold, color='r', linestyle='--', 
+               label=f'Threshold ({threshold:.2f})')
     
-    plt.title('Distribution of Anomaly Scores')
-    plt.xlabel('Anomaly Score')
-    plt.ylabel('Count')
-    plt.legend()
+    ax.set_title('Distribution of Anomaly Scores')
+    ax.set_xlabel('Anomaly Score')
+    ax.set_ylabel('Count')
+    ax.legend()
     
     # Save plot
-    plt.savefig(os.path.join(save_dir, 'score_distribution.png'), 
-                dpi=300, bbox_inches='tight')
-    plt.close()
+    save_and_clear(fig, os.path.join(save_dir, 'score_distribution.png'),
+                   dpi=300, bbox_inches='tight')
 
 def create_feature_correlation_plot(data, save_dir):
     """
@@ -79,17 +174,27 @@ def create_feature_correlation_plot(data, save_dir):
         save_dir (str): Directory to save the plot
     """
     setup_plot_style()
-    plt.figure(figsize=(10, 8))
+    fig, ax = get_figure_axes((10, 8))
     
     # Calculate and plot correlation matrix
     corr = data.corr()
     mask = np.triu(np.ones_like(corr, dtype=bool))
-    sns.heatmap(corr, mask=mask, annot=True, cmap='coolwarm', center=0,
-                fmt='.2f', square=True, linewidths=0.5)
+    image = ax.imshow(np.ma.masked_array(corr.to_numpy(), mask=mask),
+                      cmap='coolwarm', vmin=-1, vmax=1)
+    fig.colorbar(image, ax=ax)
+    
+    # Annotate the visible (lower) triangle
+    for i, j in zip(*np.nonzero(~mask)):
+        ax.text(j, i, f'{corr.iat[i, j]:.2f}', ha='center', va='center')
+    
+    ax.set_xticks(range(len(corr.columns)))
+    ax.set_xticklabels(corr.columns, rotation=90)
+    ax.set_yticks(range(len(corr.index)))
+    ax.set_yticklabels(corr.index)
+    ax.grid(False)
     
-    plt.title('Feature Correlation Matrix')
+    ax.set_title('Feature Correlation Matrix')
     
     # Save plot
-    plt.savefig(os.path.join(save_dir, 'feature_correlation.png'), 
-                dpi=300, bbox_inches='tight')
-    plt.close()
+    save_and_clear(fig, os.path.join(save_dir, 'feature_correlation.png'),
+                   dpi=300, bbox_inches='tight')